@@ -239,6 +239,8 @@ class Game:
         self.king_in_check_pos = None
         self.move_history = []
         self.move_number = 1
+        self.undo_stack = []
+        self.redo_stack = []
 
     def play_move(self, start_pos, end_pos):
         piece = self.board.get_piece(start_pos)
@@ -266,16 +268,28 @@ class Game:
         self.move_history.append(notation)
 
         captured_piece = self.board.get_piece(end_pos)
+
+        move_record = {
+            'move': (start_pos, end_pos), 'piece': piece, 'has_moved': piece.has_moved,
+            'captured_piece': captured_piece, 'en_passant_pawn': None, 'rook_has_moved': None,
+            'en_passant_target': self.board.en_passant_target, 'half_move_clock': self.half_move_clock,
+            'king_in_check_pos': self.king_in_check_pos, 'last_move': self.last_move,
+            'current_turn': self.current_turn, 'move_number': self.move_number,
+            'game_over': self.game_over, 'winner': self.winner, 'time_left': self.time_left.get(self.current_turn),
+            'position_history': None, 'position_key': None, 'promotion': None
+        }
+        self.undo_stack.append(move_record); self.redo_stack = []
         
         if isinstance(piece, Pawn) or captured_piece is not None:
-            self.half_move_clock = 0; self.position_history.clear()
+            # Movimento irreversível: guarda o segmento de posições anterior para o undo.
+            self.half_move_clock = 0; move_record['position_history'] = self.position_history; self.position_history = {}
         else:
             self.half_move_clock += 1
 
         if isinstance(piece, Pawn) and end_pos == self.board.en_passant_target:
             capture_row, capture_col = start_pos[0], end_pos[1]
             en_passant_pawn = self.board.get_piece((capture_row, capture_col))
-            if en_passant_pawn: self.captured_pieces[piece.color].append(en_passant_pawn)
+            if en_passant_pawn: self.captured_pieces[piece.color].append(en_passant_pawn); move_record['en_passant_pawn'] = en_passant_pawn
             self.board.state[capture_row][capture_col] = None
 
         self.board.move_piece(start_pos, end_pos)
@@ -289,6 +303,7 @@ class Game:
         
         if isinstance(piece, King) and abs(start_pos[1] - end_pos[1]) == 2:
             rook_start_col, rook_end_col = (7, 5) if end_pos[1] > start_pos[1] else (0, 3)
+            move_record['rook_has_moved'] = self.board.get_piece((start_pos[0], rook_start_col)).has_moved
             self.board.move_piece((start_pos[0], rook_start_col), (start_pos[0], rook_end_col))
         
         if self.time_control:
@@ -311,6 +326,7 @@ class Game:
         pawn = self.board.get_piece(position)
         if isinstance(pawn, Pawn):
             self.board.state[position[0]][position[1]] = new_piece_class(pawn.color, position)
+            if self.undo_stack: self.undo_stack[-1]['promotion'] = new_piece_class
             
             if self.move_history:
                 promoted_piece_symbol = new_piece_class('white', (0,0)).__repr__()[1]
@@ -326,6 +342,62 @@ class Game:
             
             self._update_game_state()
 
+    def undo(self):
+        if not self.undo_stack: return False
+        record = self.undo_stack[-1]
+        piece, (start_pos, end_pos) = record['piece'], record['move']
+        if isinstance(piece, Pawn) and end_pos[0] in (0, 7) and record['promotion'] is None: return False
+        self.undo_stack.pop()
+
+        if isinstance(piece, King) and abs(start_pos[1] - end_pos[1]) == 2:
+            rook_start_col, rook_end_col = (7, 5) if end_pos[1] > start_pos[1] else (0, 3)
+            rook = self.board.get_piece((start_pos[0], rook_end_col))
+            self.board.state[start_pos[0]][rook_start_col] = rook; self.board.state[start_pos[0]][rook_end_col] = None
+            rook.position = (start_pos[0], rook_start_col); rook.has_moved = record['rook_has_moved']
+
+        # Restaura a peça original (o peão, no caso de promoção) e a peça capturada.
+        self.board.state[end_pos[0]][end_pos[1]] = record['captured_piece']
+        self.board.state[start_pos[0]][start_pos[1]] = piece
+        piece.position = start_pos; piece.has_moved = record['has_moved']
+
+        en_passant_pawn = record['en_passant_pawn']
+        if en_passant_pawn:
+            self.board.state[en_passant_pawn.position[0]][en_passant_pawn.position[1]] = en_passant_pawn
+        for captured in (record['captured_piece'], en_passant_pawn):
+            if captured: self.captured_pieces[piece.color].remove(captured)
+
+        if record['position_history'] is not None:
+            self.position_history = record['position_history']
+        elif record['position_key'] is not None:
+            pos_hash = record['position_key']
+            self.position_history[pos_hash] -= 1
+            if not self.position_history[pos_hash]: del self.position_history[pos_hash]
+
+        self.move_history.pop()
+
+        self.board.en_passant_target = record['en_passant_target']
+        self.half_move_clock = record['half_move_clock']
+        self.king_in_check_pos = record['king_in_check_pos']
+        self.last_move = record['last_move']
+        self.current_turn = record['current_turn']
+        self.move_number = record['move_number']
+        self.game_over, self.winner = record['game_over'], record['winner']
+
+        # Só o relógio de quem jogou volta (sem o incremento); o tempo gasto pelo adversário não é devolvido.
+        if self.time_control: self.time_left[record['current_turn']] = record['time_left']
+        self.redo_stack.append((start_pos, end_pos, record['promotion']))
+        return True
+
+    def redo(self):
+        if not self.redo_stack or self.game_over: return False
+        start_pos, end_pos, promotion = self.redo_stack.pop()
+        redo_stack = self.redo_stack
+        result = self.play_move(start_pos, end_pos)
+        if result == 'promotion':
+            self.promote_pawn(end_pos, promotion); result = True
+        self.redo_stack = redo_stack
+        return result
+
     def resign(self):
         if not self.game_over: self.game_over = True; self.winner = f"{'black' if self.current_turn == 'white' else 'white'}_by_resignation"
     def agree_to_draw(self):
@@ -349,6 +421,7 @@ class Game:
 
         pos_hash = self.get_position_hash()
         self.position_history[pos_hash] = self.position_history.get(pos_hash, 0) + 1
+        if self.undo_stack: self.undo_stack[-1]['position_key'] = pos_hash
         
         if not self.get_all_legal_moves_for_color(self.current_turn):
             self.game_over = True
@@ -487,6 +560,9 @@ class ChessGUI(tk.Tk):
 
     def _setup_move_history(self, parent):
         history_frame = tk.LabelFrame(parent, text="Histórico de Jogadas", font=('Arial', 10, 'bold')); history_frame.pack(side=tk.BOTTOM, expand=True, fill='both', pady=10)
+        takeback_frame = tk.Frame(history_frame); takeback_frame.pack(side=tk.BOTTOM, pady=5)
+        self.takeback_buttons = {'undo': tk.Button(takeback_frame, text="◀ Voltar", command=self.handle_undo), 'redo': tk.Button(takeback_frame, text="Avançar ▶", command=self.handle_redo)}
+        self.takeback_buttons['undo'].pack(side=tk.LEFT, padx=5); self.takeback_buttons['redo'].pack(side=tk.LEFT, padx=5)
         self.move_history_text = tk.Text(history_frame, height=10, width=20, wrap=tk.WORD, font=('Arial', 11))
         scrollbar = tk.Scrollbar(history_frame, command=self.move_history_text.yview); self.move_history_text.config(yscrollcommand=scrollbar.set)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y); self.move_history_text.pack(side=tk.LEFT, expand=True, fill='both', padx=5, pady=5)
@@ -553,6 +629,8 @@ class ChessGUI(tk.Tk):
         player, opponent = self.game.current_turn, 'black' if self.game.current_turn == 'white' else 'white'
         for btn in self.action_buttons[player].values(): btn.config(state=tk.NORMAL)
         for btn in self.action_buttons[opponent].values(): btn.config(state=tk.DISABLED)
+        self.takeback_buttons['undo'].config(state=tk.NORMAL if self.game.undo_stack and not self.game.game_over else tk.DISABLED)
+        self.takeback_buttons['redo'].config(state=tk.NORMAL if self.game.redo_stack and not self.game.game_over else tk.DISABLED)
 
     def handle_draw_offer(self):
         if self.game.game_over: return
@@ -565,6 +643,15 @@ class ChessGUI(tk.Tk):
         player = "Brancas" if self.game.current_turn == 'white' else 'Pretas'
         if messagebox.askyesno("Confirmar Desistência", f"Você ({player}) tem certeza que deseja desistir?"): self.game.resign(); self.show_game_over_message()
 
+    def handle_undo(self):
+        if self.game.game_over or not self.game.undo(): return
+        self.selected_piece_pos = None; self.update_displays()
+
+    def handle_redo(self):
+        if not self.game.redo(): return
+        self.selected_piece_pos = None; self.update_displays()
+        if self.game.game_over: self.show_game_over_message()
+
     def tick_clock(self):
         if self.game.game_over: return
         player = self.game.current_turn; self.game.time_left[player] -= 1; self.update_timer_display()
@@ -0,0 +1,113 @@
+import os
+import random
+import sys
+
+import pytest
+
+pytest.importorskip("tkinter")
+pytest.importorskip("PIL")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "code"))
+from Chess import Game, King, Pawn, Queen, Knight, Rook, Bishop
+
+SEEDS = [0, 2, 3, 4]
+MAX_PLIES = 160
+
+
+def snapshot(game):
+    pieces = tuple((type(p).__name__, p.color, p.position, p.has_moved)
+                   for row in game.board.state for p in row if p)
+    captured = {color: tuple(repr(p) for p in game.captured_pieces[color]) for color in ('white', 'black')}
+    return (pieces, game.board.en_passant_target, game.half_move_clock, dict(game.position_history),
+            tuple(game.move_history), captured, game.king_in_check_pos, game.last_move, game.current_turn,
+            game.move_number, game.game_over, game.winner, dict(game.time_left))
+
+
+def play_random_game(seed):
+    rng = random.Random(seed)
+    game = Game(time_control=(600, 2))
+    snapshots, promotions = [], 0
+    while not game.game_over and len(game.move_history) < MAX_PLIES:
+        snapshots.append(snapshot(game))
+        piece = rng.choice([p for p in game.get_all_pieces(game.current_turn) if game.get_legal_moves(p)])
+        end_pos = rng.choice(game.get_legal_moves(piece))
+        if game.play_move(piece.position, end_pos) == 'promotion':
+            game.promote_pawn(end_pos, rng.choice([Queen, Rook, Bishop, Knight])); promotions += 1
+    snapshots.append(snapshot(game))
+    return game, snapshots, promotions
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_undo_and_redo_long_random_games(seed):
+    game, snapshots, promotions = play_random_game(seed)
+    plies = len(game.undo_stack)
+    assert plies == len(snapshots) - 1 >= 150
+    assert promotions > 0
+
+    for i in range(plies, 0, -1):
+        assert game.undo()
+        assert snapshot(game) == snapshots[i - 1]
+    assert not game.undo()
+    assert snapshot(game) == snapshots[0]
+
+    for i in range(1, plies + 1):
+        assert game.redo()
+        assert snapshot(game) == snapshots[i]
+    assert not game.redo()
+
+
+def test_undo_restores_only_the_movers_clock():
+    game = Game(time_control=(600, 5))
+    game.time_left['white'] -= 10
+    game.play_move((6, 4), (4, 4))
+    assert game.time_left == {'white': 595, 'black': 600}
+    game.time_left['black'] -= 20
+    assert game.undo()
+    assert game.time_left == {'white': 590, 'black': 580}
+    assert game.redo()
+    assert game.time_left == {'white': 595, 'black': 580}
+
+
+def test_new_move_clears_redo_stack():
+    game = Game()
+    game.play_move((6, 4), (4, 4)); game.undo()
+    assert game.redo_stack
+    game.play_move((6, 3), (4, 3))
+    assert not game.redo_stack and not game.redo()
+
+
+def test_threefold_repetition_after_undo_and_redo():
+    shuffle = [((7, 6), (5, 5)), ((0, 6), (2, 5)), ((5, 5), (7, 6)), ((2, 5), (0, 6))]
+    game = Game()
+    game.play_move((6, 4), (4, 4)); game.play_move((1, 4), (3, 4))
+    for start_pos, end_pos in shuffle * 2:
+        assert game.play_move(start_pos, end_pos)
+    assert not game.game_over
+
+    while game.undo(): pass
+    assert game.position_history == {}
+    while game.redo(): pass
+    assert not game.game_over
+
+    game.play_move(*shuffle[0])
+    assert game.game_over and game.winner == 'draw_repetition'
+
+    assert game.undo()
+    assert not game.game_over and game.winner is None
+    assert game.redo()
+    assert game.game_over and game.winner == 'draw_repetition'
+
+
+def test_undo_refuses_pending_promotion():
+    game = Game()
+    game.board.state = [[None for _ in range(8)] for _ in range(8)]
+    for piece in (King('white', (7, 4)), King('black', (0, 0)), Pawn('white', (1, 7))):
+        piece.has_moved = True; game.board.state[piece.position[0]][piece.position[1]] = piece
+
+    assert game.play_move((1, 7), (0, 7)) == 'promotion'
+    assert not game.undo()
+    game.promote_pawn((0, 7), Queen)
+    assert game.undo()
+    assert isinstance(game.board.get_piece((1, 7)), Pawn) and game.board.get_piece((0, 7)) is None
+    assert game.redo()
+    assert isinstance(game.board.get_piece((0, 7)), Queen) and game.current_turn == 'black'